@@ -7,6 +7,7 @@ from typing import Dict, Tuple
 from src.maze_py import (
     AnimationRecorder,
     AsciiRenderer,
+    BidirectionalBFSSolver,
     BinaryTreeGenerator,
     BreadthFirstSolver,
     # DepthFirstSolver,
@@ -27,6 +28,7 @@ GENERATORS = {
 
 SOLVERS = {
     "bfs": BreadthFirstSolver,
+    "bidirectional": BidirectionalBFSSolver,
     # "dfs": DepthFirstSolver,
     # "dijkstra": DijkstraSolver,
 }
@@ -107,16 +109,15 @@ def main() -> None:
     else:
         print(f"\n{args.solver.upper()} solver could not reach the target.")
 
-    result = solver_solutions["bfs"]
-
-    stats = result.stats
-    status = "Y" if result.found else "N"
-    print(
-        f"  {key.upper():>8} {status}  "
-        f"path={stats.path_length:3d}  "
-        f"visited={stats.nodes_expanded:4d}  "
-        f"time={stats.runtime_ms:7.2f}ms"
-    )
+    for key, result in solver_solutions.items():
+        stats = result.stats
+        status = "Y" if result.found else "N"
+        print(
+            f"  {key.upper():>8} {status}  "
+            f"path={stats.path_length:3d}  "
+            f"visited={stats.nodes_expanded:4d}  "
+            f"time={stats.runtime_ms:7.2f}ms"
+        )
 
     if args.export_json and recorder:
         output_path = write_animation_package(
@@ -10,6 +10,7 @@ from .generators import (
 
 from .renderers.ascii import AsciiRenderer
 from .solvers import (
+    BidirectionalBFSSolver,
     BreadthFirstSolver,
     # DepthFirstSolver,
     # DijkstraSolver,
@@ -24,6 +25,7 @@ __all__ = [
     "BinaryTreeGenerator",
     "RandomGrowthGenerator",
     "BreadthFirstSolver",
+    "BidirectionalBFSSolver",
     # "DepthFirstSolver",
     # "DijkstraSolver",
     "MazeSolution",
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Literal
+from sys import intern
+from typing import Any, Dict, Iterator, List, Literal, Tuple
 
 Phase = Literal["generate", "solve"]
 
@@ -14,23 +15,30 @@ class AnimationEvent:
     event: str
     payload: Dict[str, Any]
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {"phase": self.phase, "event": self.event, **self.payload}
-
 
 class AnimationRecorder:
     """Collects generator and solver events for later playback/export."""
 
     def __init__(self) -> None:
-        self._events: List[AnimationEvent] = []
+        # Raw (phase, event, payload) tuples; AnimationEvent objects are only
+        # built on demand so recording stays a single append.
+        self._events: List[Tuple[Phase, str, Dict[str, Any]]] = []
 
     def record(self, phase: Phase, event: str, **payload: Any) -> None:
-        self._events.append(AnimationEvent(phase=phase, event=event, payload=payload))
+        # Interned names: every event shares the same handful of str objects,
+        # even when callers build them dynamically, and compare by identity.
+        self._events.append((intern(phase), intern(event), payload))
 
     @property
     def events(self) -> List[AnimationEvent]:
-        return list(self._events)
+        return [AnimationEvent(*evt) for evt in self._events]
 
-    def to_serializable(self) -> List[Dict[str, Any]]:
-        return [evt.to_dict() for evt in self._events]
+    def iter_raw(self) -> Iterator[Tuple[Phase, str, Dict[str, Any]]]:
+        """Yield the stored (phase, event, payload) tuples without copying them."""
+        return iter(self._events)
 
+    def to_serializable(self) -> List[Dict[str, Any]]:
+        return [
+            {"phase": phase, "event": event, **payload}
+            for phase, event, payload in self._events
+        ]
@@ -4,13 +4,25 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Tuple
+
+try:  # orjson is an optional, much faster encoder; fall back to the stdlib
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 from .animation import AnimationRecorder
 from .grid import MazeGrid, MazeTree
 from .solvers.results import MazeSolution
 
 
+def _dumps(value: Any) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
 def write_animation_package(
     destination: str | Path,
     grid: MazeGrid,
@@ -21,17 +33,35 @@ def write_animation_package(
     start: Tuple[int, int],
     target: Tuple[int, int],
 ) -> Path:
-    """Serialize the run metadata and event stream into a JSON file."""
+    """Serialize the run metadata and event stream into a JSON file.
 
-    payload = {
+    Events are encoded and written one per line as they are read from the
+    recorder, so no full event list or document string is held in memory.
+    """
+
+    header = {
         "grid": {"width": grid.width, "height": grid.height},
         "start": list(start),
         "target": list(target),
         "found": solution.found,
-        "events": recorder.to_serializable(),
     }
     destination_path = Path(destination).expanduser().resolve()
     destination_path.parent.mkdir(parents=True, exist_ok=True)
-    destination_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with destination_path.open("wb") as handle:
+        # Reopen the header object so "events" becomes its last key.
+        handle.write(_dumps(header)[:-1] + b',"events":[')
+        # Each event is written as its cached {"phase":..,"event":.. prefix
+        # spliced onto the encoded payload, so no merged dict is ever built.
+        prefixes: Dict[Tuple[str, str], bytes] = {}
+        separator = b"\n"
+        for phase, event, payload in recorder.iter_raw():
+            prefix = prefixes.get((phase, event))
+            if prefix is None:
+                prefix = _dumps({"phase": phase, "event": event})[:-1]
+                prefixes[(phase, event)] = prefix
+            body = _dumps(payload)
+            handle.write(separator)
+            handle.write(prefix + b"," + body[1:] if len(body) > 2 else prefix + b"}")
+            separator = b",\n"
+        handle.write(b"\n]}\n")
     return destination_path
-
@@ -1,12 +1,14 @@
 """Generators package export."""
 
 from .binary_tree import BinaryTreeGenerator
+from .parallel_spanning_tree import ParallelSpanningTreeGenerator
 from .random_growth import RandomGrowthGenerator
 from .spanning_tree import SpanningTreeGenerator
 
 
 __all__ = [
     "BinaryTreeGenerator",
+    "ParallelSpanningTreeGenerator",
     "RandomGrowthGenerator",
     "SpanningTreeGenerator",
 ]
@@ -28,70 +28,106 @@ class BinaryTreeGenerator(MazeGenerator):
         # Шаг 1: Сброс состояния сетки - удаление всех существующих связей
         grid.reset()
 
-        # Шаг 2: Список для сохранения порядка обработки ячеек
-        visit_order: List[Cell] = []
-
-        # Шаг 3: Получение стартовой ячейки (корня дерева)
+        # Шаг 2: Получение стартовой ячейки (корня дерева)
         root = grid.cell(*start)
 
-        # Шаг 4: Основной двойной цикл - проход по всем ячейкам сетки
+        # Шаг 3: Разыгрываем все случайные решения одним вызовом
+        # Бит ячейки (x, y) лежит по индексу y * width + x: '0' - восток, '1' - юг.
+        # format превращает число в строку за линейное время, поэтому в цикле
+        # остается только чтение символа вместо вызова choice для каждой ячейки
+        total = grid.width * grid.height
+        draws = format(self._random.getrandbits(total), f"0{total}b")
+
+        # Шаг 4: Вариант обхода выбирается один раз: без рекордера работает
+        # цикл, в котором нет ни одной проверки записи анимации
+        if recorder is None:
+            visit_order = self._carve(grid, draws)
+        else:
+            visit_order = self._carve_recorded(grid, draws, recorder)
+
+        # Шаг 5: Возвращаем готовый лабиринт в виде дерева
+        return MazeTree(grid=grid, root=root, visit_order=visit_order)
+
+    def _carve(self, grid: MazeGrid, draws: str) -> List[Cell]:
+        """Соединяет каждую ячейку с соседом по ``draws``; возвращает порядок обхода."""
+        width, height = grid.width, grid.height
+
+        # Шаг 1: Список для сохранения порядка обработки ячеек
+        visit_order: List[Cell] = []
+
+        # Шаг 2: Основной двойной цикл - проход по всем ячейкам сетки
         # Проходим по строкам (y) и столбцам (x) в порядке от левого верхнего угла
         # к правому нижнему
-        for y in range(grid.height):
-            for x in range(grid.width):
-                # Шаг 4a: Получаем текущую ячейку
-                cell = grid.cell(x, y)
+        for y in range(height):
+            # Шаг 2a: Южный сосед есть у всех ячеек, кроме нижней строки
+            has_south = y + 1 < height
+            row_offset = y * width
 
-                # Шаг 4b: Добавляем ячейку в список посещенных
+            for x in range(width):
+                # Шаг 2b: Получаем текущую ячейку и добавляем ее в список посещенных
+                cell = grid.cell(x, y)
                 visit_order.append(cell)
 
-                # Шаг 4c: Если есть рекордер, записываем обработку ячейки
-                if recorder:
-                    recorder.record(
-                        "generate",
-                        "activate",
-                        cell=[x, y],
-                        step=len(visit_order),  # Используем длину списка как номер шага
-                    )
-
-                # Шаг 5: Определяем возможные направления для соединения
-                # Инициализируем список кандидатов
-                choices = []
-
-                # Шаг 5a: Проверяем возможность соединения с восточным соседом (x+1)
-                if grid.contains(x + 1, y):
-                    choices.append(grid.cell(x + 1, y))
-
-                # Шаг 5b: Проверяем возможность соединения с южным соседом (y+1)
-                if grid.contains(x, y + 1):
-                    choices.append(grid.cell(x, y + 1))
-
-                # Шаг 6: Проверяем, есть ли доступные соседи
-                # Для ячеек в правом нижнем углу список choices будет пуст
-                if not choices:
-                    # Пропускаем эту ячейку - она уже соединена или является угловой
+                # Шаг 3: Выбираем соседа
+                # Восток - если он есть и (юга нет или выпал '0'), иначе юг.
+                # Для правой нижней ячейки соседей нет - пропускаем ее
+                if x + 1 < width and (not has_south or draws[row_offset + x] == "0"):
+                    neighbor = grid.cell(x + 1, y)
+                elif has_south:
+                    neighbor = grid.cell(x, y + 1)
+                else:
                     continue
 
-                # Шаг 7: Выбираем случайного соседа из доступных вариантов
-                neighbor = self._random.choice(choices)
-
-                # Шаг 8: Создаем проход между ячейками
+                # Шаг 4: Создаем проход между ячейками
                 # Убираем стену между текущей ячейкой и выбранным соседом
                 grid.link(cell, neighbor)
 
-                # Шаг 9: Устанавливаем связи в дереве лабиринта
+                # Шаг 5: Устанавливаем связи в дереве лабиринта
                 # Сосед становится ребенком текущей ячейки
                 neighbor.parent = cell
                 cell.children.append(neighbor)
 
-                # Шаг 10: Если есть рекордер, записываем создание связи
-                if recorder:
-                    recorder.record(
-                        "generate",
-                        "link",
-                        parent=[cell.x, cell.y],
-                        child=[neighbor.x, neighbor.y],
-                    )
+        return visit_order
 
-        # Шаг 11: Возвращаем готовый лабиринт в виде дерева
-        return MazeTree(grid=grid, root=root, visit_order=visit_order)
+    def _carve_recorded(
+        self,
+        grid: MazeGrid,
+        draws: str,
+        recorder: AnimationRecorder,
+    ) -> List[Cell]:
+        """То же, что и ``_carve``, но с записью каждого шага в ``recorder``."""
+        width, height = grid.width, grid.height
+        visit_order: List[Cell] = []
+        record = recorder.record
+
+        for y in range(height):
+            has_south = y + 1 < height
+            row_offset = y * width
+
+            for x in range(width):
+                cell = grid.cell(x, y)
+                visit_order.append(cell)
+
+                # Записываем обработку ячейки (номер шага - длина списка)
+                record("generate", "activate", cell=cell.coords, step=len(visit_order))
+
+                if x + 1 < width and (not has_south or draws[row_offset + x] == "0"):
+                    neighbor = grid.cell(x + 1, y)
+                elif has_south:
+                    neighbor = grid.cell(x, y + 1)
+                else:
+                    continue
+
+                grid.link(cell, neighbor)
+                neighbor.parent = cell
+                cell.children.append(neighbor)
+
+                # Записываем создание связи
+                record(
+                    "generate",
+                    "link",
+                    parent=cell.coords,
+                    child=neighbor.coords,
+                )
+
+        return visit_order
@@ -0,0 +1,323 @@
+"""Генератор лабиринта из независимых плиток, построенных параллельно."""
+
+from __future__ import annotations
+
+import random
+import sys
+from array import array
+from bisect import bisect_right
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Sequence, Tuple
+
+from ..animation import AnimationRecorder
+from ..grid import EAST, NORTH, SOUTH, WEST, Cell, MazeGrid, MazeTree
+from .base import MazeGenerator
+
+# Плитка: полуоткрытые диапазоны координат (x0, x1, y0, y1)
+Tile = Tuple[int, int, int, int]
+
+# Задание для рабочего: (плитка, высота сетки, клетка входа, seed)
+TileJob = Tuple[Tile, int, int, int]
+
+# Дерево над индексами: (родители, порядок посещения, порядок прокладки проходов)
+TileTree = Tuple[array, array, array]
+
+# Результат рабочего - уже в индексах сетки: (дочерние клетки в порядке
+# прокладки проходов, их родители, порядок посещения, маска проходов плитки
+# по столбцам)
+TileResult = Tuple[array, array, array, bytes]
+
+# Меньшие сетки строятся на месте: запуск пула процессов и передача
+# результатов стоят дороже, чем построение всех плиток в одном процессе
+MIN_PARALLEL_CELLS = 250_000
+
+
+def _neighbor_ids(width: int, height: int) -> List[Tuple[int, ...]]:
+    """
+    Таблица соседей прямоугольника ``width`` x ``height`` в виде индексов.
+
+    Индексация (x * height + y) и порядок соседей (восток, запад, юг, север)
+    те же, что и у ``MazeGrid``.
+    """
+    table: List[Tuple[int, ...]] = []
+    for x in range(width):
+        for y in range(height):
+            idx = x * height + y
+            neighbors: List[int] = []
+            if x + 1 < width:
+                neighbors.append(idx + height)
+            if x > 0:
+                neighbors.append(idx - height)
+            if y + 1 < height:
+                neighbors.append(idx + 1)
+            if y > 0:
+                neighbors.append(idx - 1)
+            table.append(tuple(neighbors))
+    return table
+
+
+def _spanning_tree(
+    neighbor_ids: Sequence[Tuple[int, ...]],
+    root: int,
+    rng: random.Random,
+) -> TileTree:
+    """Случайный обход фронта (как в SpanningTreeGenerator) над индексами."""
+    size = len(neighbor_ids)
+    parent_ids = array("i", [-1]) * size
+    visit_order = array("i")
+    link_order = array("i")
+    visited = bytearray(size)
+    visited[root] = 1
+
+    rand = rng.random
+    frontier: List[int] = [root]
+    while frontier:
+        # Извлекаем случайный элемент за O(1): на его место ставим последний
+        idx = int(rand() * len(frontier))
+        cell = frontier[idx]
+        frontier[idx] = frontier[-1]
+        frontier.pop()
+        visit_order.append(cell)
+
+        for neighbor in neighbor_ids[cell]:
+            if visited[neighbor]:
+                continue
+            visited[neighbor] = 1
+            parent_ids[neighbor] = cell
+            link_order.append(neighbor)
+            frontier.append(neighbor)
+
+    return parent_ids, visit_order, link_order
+
+
+def _carve_tile(tile: Tile, grid_height: int, entry: int, seed: int) -> TileResult:
+    """
+    Строит остовное дерево одной плитки; выполняется в рабочем процессе.
+
+    Здесь же, параллельно, выполняется вся работа над индексами: маска
+    проходов плитки и перевод локальных индексов в индексы сетки. Основному
+    процессу остается скопировать маску и связать клетки.
+    """
+    x0, x1, y0, y1 = tile
+    tile_height = y1 - y0
+    root = (entry // grid_height - x0) * tile_height + entry % grid_height - y0
+    parents, visits, links = _spanning_tree(
+        _neighbor_ids(x1 - x0, tile_height), root, random.Random(seed)
+    )
+
+    # Маска проходов в локальной индексации плитки (x * tile_height + y).
+    # Горизонтальный сдвиг проверяется первым: при высоте плитки 1 он равен ±1
+    mask = bytearray(len(parents))
+    for child in links:
+        parent = parents[child]
+        delta = child - parent
+        if delta == tile_height:
+            mask[parent] |= EAST
+            mask[child] |= WEST
+        elif delta == -tile_height:
+            mask[parent] |= WEST
+            mask[child] |= EAST
+        elif delta == 1:
+            mask[parent] |= SOUTH
+            mask[child] |= NORTH
+        else:
+            mask[parent] |= NORTH
+            mask[child] |= SOUTH
+
+    # Локальный индекс -> индекс сетки: столбец плитки - непрерывный отрезок
+    to_global: List[int] = []
+    for x in range(x0, x1):
+        start = x * grid_height + y0
+        to_global.extend(range(start, start + tile_height))
+
+    return (
+        array("i", [to_global[child] for child in links]),
+        array("i", [to_global[parents[child]] for child in links]),
+        array("i", [to_global[cell] for cell in visits]),
+        bytes(mask),
+    )
+
+
+def _bounds(size: int, parts: int) -> List[int]:
+    """Делит отрезок [0, size) на ``parts`` почти равных частей."""
+    return [size * i // parts for i in range(parts + 1)]
+
+
+def _executor(workers: int | None) -> Executor:
+    """Пул потоков на сборке Python без GIL (3.13+), иначе пул процессов."""
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if not gil_enabled:
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+class ParallelSpanningTreeGenerator(MazeGenerator):
+    """
+    Строит остовное дерево по плиткам параллельно и сшивает плитки проходами.
+
+    Сетка делится на ``tiles`` x ``tiles`` плиток. Какие плитки соединяются,
+    задает случайное остовное дерево над самими плитками; для каждого его
+    ребра через общую границу прокладывается ровно один проход. Затем в
+    каждой плитке независимо (в отдельном процессе) строится случайное
+    остовное дерево с корнем в клетке входа, так что результат - тоже
+    остовное дерево всей сетки с корнем в ``start``.
+
+    Распределение лабиринтов при этом не совпадает с SpanningTreeGenerator:
+    через границы плиток проходит всего по одному проходу. Поэтому генератор
+    подключается явно и не заменяет обычный.
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int | None = None,
+        tiles: int = 4,
+        workers: int | None = None,
+    ):
+        if tiles <= 0:
+            raise ValueError("Число плиток должно быть положительным.")
+        # Инициализация генератора случайных чисел
+        # Из него берутся дерево плиток, проходы между ними и seed каждой плитки
+        self._random = random.Random(seed)
+        self._tiles = tiles
+        self._workers = workers
+
+    def generate(
+        self,
+        grid: MazeGrid,  # Сетка лабиринта
+        start: Tuple[int, int],  # Стартовая точка (корень итогового дерева)
+        *,  # Все следующие параметры должны передаваться по ключу
+        recorder: AnimationRecorder | None = None,  # Для записи анимации процесса
+    ) -> MazeTree:
+        # Шаг 1: Сброс состояния сетки и получение корня
+        grid.reset()
+        root = grid.cell(*start)
+        height = grid.height
+
+        # Шаг 2: Разбиваем сетку на плитки (по оси - не больше плиток, чем клеток)
+        # Плитка (tx, ty) имеет индекс tx * tiles_y + ty - так же, как клетки сетки
+        tiles_x = min(self._tiles, grid.width)
+        tiles_y = min(self._tiles, height)
+        xs = _bounds(grid.width, tiles_x)
+        ys = _bounds(height, tiles_y)
+        tiles: List[Tile] = [
+            (xs[tx], xs[tx + 1], ys[ty], ys[ty + 1])
+            for tx in range(tiles_x)
+            for ty in range(tiles_y)
+        ]
+
+        # Шаг 3: Случайное остовное дерево над плитками: какие плитки сшиваются
+        root_tile = (bisect_right(xs, root.x) - 1) * tiles_y + bisect_right(ys, root.y) - 1
+        tile_parents, _, tile_links = _spanning_tree(
+            _neighbor_ids(tiles_x, tiles_y), root_tile, self._random
+        )
+        tile_order = [root_tile, *tile_links]
+
+        # Шаг 4: Для каждого ребра дерева плиток выбираем проход через границу.
+        # Клетка входа становится корнем дерева дочерней плитки, а ее
+        # родителем - соседняя клетка родительской плитки
+        entries = [root.index] * len(tiles)
+        bridges: Dict[int, int] = {}  # клетка входа -> клетка-родитель
+        for tile in tile_links:
+            entry, parent = self._bridge(tiles[tile_parents[tile]], tiles[tile], height)
+            entries[tile] = entry
+            bridges[entry] = parent
+
+        # Шаг 5: Строим деревья плиток - независимо, поэтому параллельно
+        jobs: List[TileJob] = [
+            (tile, height, entry, self._random.getrandbits(64))
+            for tile, entry in zip(tiles, entries)
+        ]
+        results = self._run(jobs, grid.width * height)
+
+        # Шаг 6: Переносим деревья плиток на сетку. Плитки идут в порядке
+        # дерева плиток, поэтому родительская плитка всегда уже на месте;
+        # проход-мост прокладывается перед деревом своей плитки
+        visited = self._attach(grid, tiles, tile_order, results, bridges, entries)
+
+        # Шаг 7: Анимация восстанавливается по готовому дереву: плитки строились
+        # в других процессах, и рекордер туда не передается
+        if recorder is not None:
+            self._replay(recorder, visited, bridges)
+
+        return MazeTree(grid=grid, root=root, visit_order=visited)
+
+    def _bridge(self, parent: Tile, child: Tile, height: int) -> Tuple[int, int]:
+        """Выбирает проход между соседними плитками: (клетка входа, клетка-родитель)."""
+        px0, px1, py0, py1 = parent
+        cx0, cx1, cy0, cy1 = child
+        if px0 == cx0:
+            # Плитки в одном столбце - граница горизонтальная
+            x = self._random.randrange(cx0, cx1)
+            parent_y, child_y = (py1 - 1, cy0) if py1 == cy0 else (py0, cy1 - 1)
+            return x * height + child_y, x * height + parent_y
+        # Плитки в одной строке - граница вертикальная
+        y = self._random.randrange(cy0, cy1)
+        parent_x, child_x = (px1 - 1, cx0) if px1 == cx0 else (px0, cx1 - 1)
+        return child_x * height + y, parent_x * height + y
+
+    @staticmethod
+    def _attach(
+        grid: MazeGrid,
+        tiles: Sequence[Tile],
+        tile_order: Sequence[int],
+        results: Sequence[TileResult],
+        bridges: Dict[int, int],
+        entries: Sequence[int],
+    ) -> List[Cell]:
+        """Копирует маски плиток, связывает клетки и возвращает порядок посещения."""
+        height = grid.height
+        mask = grid.link_mask
+        cell_at = grid.cell_at
+        visit_order: List[Cell] = []
+
+        for tile in tile_order:
+            x0, x1, y0, y1 = tiles[tile]
+            tile_height = y1 - y0
+            links, parents, visits, tile_mask = results[tile]
+
+            # Столбец плитки - непрерывный отрезок и в маске сетки
+            for column, x in enumerate(range(x0, x1)):
+                start = x * height + y0
+                mask[start : start + tile_height] = tile_mask[
+                    column * tile_height : (column + 1) * tile_height
+                ]
+
+            entry = entries[tile]
+            if entry in bridges:
+                child, parent = cell_at(entry), cell_at(bridges[entry])
+                grid.link(parent, child)
+                child.parent = parent
+                parent.children.append(child)
+
+            for child, parent in zip(map(cell_at, links), map(cell_at, parents)):
+                child.parent = parent
+                parent.children.append(child)
+            visit_order.extend(map(cell_at, visits))
+
+        return visit_order
+
+    def _run(self, jobs: Sequence[TileJob], size: int) -> List[TileResult]:
+        """Выполняет задания плиток в пуле или, если он не нужен, на месте."""
+        if len(jobs) == 1 or self._workers == 1 or size < MIN_PARALLEL_CELLS:
+            return [_carve_tile(*job) for job in jobs]
+        with _executor(self._workers) as pool:
+            return list(pool.map(_carve_tile, *zip(*jobs)))
+
+    @staticmethod
+    def _replay(
+        recorder: AnimationRecorder,
+        visit_order: List[Cell],
+        bridges: Dict[int, int],
+    ) -> None:
+        """Записывает события в том же формате, что и SpanningTreeGenerator."""
+        record = recorder.record
+        for step, cell in enumerate(visit_order):
+            # Клетка входа посещается первой в своей плитке - перед ней
+            # показываем проход из родительской плитки
+            if cell.index in bridges and cell.parent is not None:
+                record("generate", "link", parent=cell.parent.coords, child=cell.coords)
+            record("generate", "activate", cell=cell.coords, step=step)
+            for child in cell.children:
+                if child.index not in bridges:
+                    record("generate", "link", parent=cell.coords, child=child.coords)
@@ -31,87 +31,137 @@ class RandomGrowthGenerator(MazeGenerator):
         # Шаг 2: Получаем стартовую ячейку по координатам
         root = grid.cell(*start)
 
-        # Шаг 3: Список для сохранения порядка посещения ячеек
+        # Шаг 3: Вариант обхода выбирается один раз: без рекордера работает
+        # цикл, в котором нет ни одной проверки записи анимации
+        if recorder is None:
+            visit_order = self._carve(grid, root)
+        else:
+            visit_order = self._carve_recorded(grid, root, recorder)
+
+        # Шаг 4: Возвращаем готовый лабиринт в виде дерева
+        return MazeTree(grid=grid, root=root, visit_order=visit_order)
+
+    def _carve(self, grid: MazeGrid, root: Cell) -> List[Cell]:
+        """Выращивает дерево от ``root`` и возвращает порядок посещения."""
+        # Один вызов random() через связанный метод дешевле randrange()
+        # и choice(): те выполняют несколько Python-функций на каждое число
+        rand = self._random.random
+
+        # Шаг 1: Список для сохранения порядка посещения ячеек
         # Полезно для анимации и анализа алгоритма
         visit_order: List[Cell] = []
 
-        # Шаг 4: Список "активных" ячеек - это ячейки, которые могут "расти"
+        # Шаг 2: Список "активных" ячеек - это ячейки, которые могут "расти"
         # Активная ячейка имеет хотя бы одного непосещенного соседа
         active: List[Cell] = [root]
 
-        # Шаг 5: Множество посещенных ячеек (храним координаты для быстрого поиска)
-        visited = {root.coords}
-
-        # Шаг 6: Счетчик шагов для анимации
-        step = 0
+        # Шаг 3: Отметки посещения - по байту на клетку, по индексу клетки.
+        # Чтение байта дешевле поиска в множестве и занимает 1 байт на клетку
+        visited = bytearray(grid.width * grid.height)
+        visited[root.index] = 1
 
-        # Шаг 7: Основной цикл алгоритма - продолжается, пока есть активные ячейки
+        # Шаг 4: Основной цикл алгоритма - продолжается, пока есть активные ячейки
         while active:
-            # Шаг 7a: Случайный выбор активной ячейки
+            # Шаг 4a: Случайный выбор активной ячейки
             # В отличие от алгоритма Прима, мы не удаляем ячейку сразу
-            idx = self._random.randrange(len(active))
+            idx = int(rand() * len(active))
             cell = active[idx]
 
-            # Шаг 7b: Записываем текущую ячейку в историю посещений
+            # Шаг 4b: Записываем текущую ячейку в историю посещений
             visit_order.append(cell)
 
-            # Шаг 7c: Если есть рекордер, записываем активацию ячейки
-            if recorder:
-                recorder.record(
-                    "generate",
-                    "activate",
-                    cell=list(
-                        cell.coords
-                    ),  # Преобразуем кортеж в список для сериализации
-                    step=step,
-                )
-            step += 1
-
-            # Шаг 8: Ищем кандидатов для роста
+            # Шаг 5: Ищем кандидатов для роста
             # Собираем всех непосещенных соседей текущей ячейки
             candidates = [
                 neighbor
                 for neighbor in grid.neighbors(cell)
-                if neighbor.coords not in visited
+                if not visited[neighbor.index]
             ]
 
-            # Шаг 9: Проверяем, есть ли куда расти
+            # Шаг 6: Проверяем, есть ли куда расти
             if not candidates:
-                # Шаг 9a: Если у ячейки нет непосещенных соседей
-                # Удаляем ее из списка активных - она больше не может расти
-                active.pop(idx)
+                # Шаг 6a: Если у ячейки нет непосещенных соседей
+                # Удаляем ее из списка активных - она больше не может расти.
+                # Меняем местами с последним элементом и снимаем хвост за O(1):
+                # порядок активных не важен, индекс все равно выбирается случайно
+                active[idx] = active[-1]
+                active.pop()
                 # Переходим к следующей итерации
                 continue
 
-            # Шаг 10: Рост - выбираем случайного соседа для присоединения
-            neighbor = self._random.choice(candidates)
+            # Шаг 7: Рост - выбираем случайного соседа для присоединения
+            neighbor = candidates[int(rand() * len(candidates))]
 
-            # Шаг 10a: Помечаем соседа как посещенного
-            visited.add(neighbor.coords)
+            # Шаг 7a: Помечаем соседа как посещенного
+            visited[neighbor.index] = 1
 
-            # Шаг 10b: Убираем стену между текущей ячейкой и выбранным соседом
+            # Шаг 7b: Убираем стену между текущей ячейкой и выбранным соседом
             # Это создает проход в лабиринте
             grid.link(cell, neighbor)
 
-            # Шаг 10c: Устанавливаем родительскую связь
+            # Шаг 7c: Устанавливаем родительскую связь
             # Текущая ячейка становится родителем соседа в дереве лабиринта
             neighbor.parent = cell
 
-            # Шаг 10d: Добавляем соседа в список детей текущей ячейки
+            # Шаг 7d: Добавляем соседа в список детей текущей ячейки
             cell.children.append(neighbor)
 
-            # Шаг 10e: Добавляем соседа в список активных ячеек
+            # Шаг 7e: Добавляем соседа в список активных ячеек
             # Теперь он может расти дальше
             active.append(neighbor)
 
-            # Шаг 10f: Если есть рекордер, записываем создание связи
-            if recorder:
-                recorder.record(
-                    "generate",
-                    "link",
-                    parent=list(cell.coords),
-                    child=list(neighbor.coords),
-                )
+        return visit_order
 
-        # Шаг 11: Возвращаем готовый лабиринт в виде дерева
-        return MazeTree(grid=grid, root=root, visit_order=visit_order)
+    def _carve_recorded(
+        self,
+        grid: MazeGrid,
+        root: Cell,
+        recorder: AnimationRecorder,
+    ) -> List[Cell]:
+        """То же, что и ``_carve``, но с записью каждого шага в ``recorder``."""
+        visit_order: List[Cell] = []
+        active: List[Cell] = [root]
+        visited = bytearray(grid.width * grid.height)
+        visited[root.index] = 1
+        record = recorder.record
+        rand = self._random.random
+
+        # Счетчик шагов для анимации
+        step = 0
+
+        while active:
+            # Те же вызовы random(), что и в ``_carve``
+            idx = int(rand() * len(active))
+            cell = active[idx]
+            visit_order.append(cell)
+
+            # Записываем активацию ячейки
+            record("generate", "activate", cell=cell.coords, step=step)
+            step += 1
+
+            candidates = [
+                neighbor
+                for neighbor in grid.neighbors(cell)
+                if not visited[neighbor.index]
+            ]
+            if not candidates:
+                active[idx] = active[-1]
+                active.pop()
+                continue
+
+            neighbor = candidates[int(rand() * len(candidates))]
+            visited[neighbor.index] = 1
+            grid.link(cell, neighbor)
+            neighbor.parent = cell
+            cell.children.append(neighbor)
+            active.append(neighbor)
+
+            # Записываем создание связи
+            record(
+                "generate",
+                "link",
+                parent=cell.coords,
+                child=neighbor.coords,
+            )
+
+        return visit_order
@@ -32,76 +32,122 @@ class SpanningTreeGenerator(MazeGenerator):
         root = grid.cell(*start)
         root.parent = None  # Устанавливаем корень дерева (родителя нет)
 
-        # Шаг 3: Список для сохранения порядка посещения ячеек (для отладки/анимации)
+        # Шаг 3: Вариант обхода выбирается один раз: без рекордера работает
+        # цикл, в котором нет ни одной проверки записи анимации
+        if recorder is None:
+            visit_order = self._carve(grid, root)
+        else:
+            visit_order = self._carve_recorded(grid, root, recorder)
+
+        # Шаг 4: Возвращаем результат - дерево лабиринта
+        # Содержит сетку, корень и порядок посещения ячеек
+        return MazeTree(grid=grid, root=root, visit_order=visit_order)
+
+    def _carve(self, grid: MazeGrid, root: Cell) -> List[Cell]:
+        """Строит остовное дерево от ``root`` и возвращает порядок посещения."""
+        # Один вызов random() через связанный метод дешевле randrange():
+        # тот выполняет несколько Python-функций на каждое число
+        rand = self._random.random
+
+        # Шаг 1: Список для сохранения порядка посещения ячеек (для отладки/анимации)
         visit_order: List[Cell] = []
 
-        # Шаг 4: Инициализация "фронта" - списка ячеек, которые уже посещены,
+        # Шаг 2: Инициализация "фронта" - списка ячеек, которые уже посещены,
         # но имеют непосещенных соседей. Фронт начинает с одной ячейки - корня
         frontier: List[Cell] = [root]
 
-        # Шаг 5: Множество для быстрой проверки, посещена ли ячейка
-        # Храним координаты для эффективного сравнения
-        visited = {root.coords}
+        # Шаг 3: Отметки посещения - по байту на клетку, по индексу клетки.
+        # Чтение байта дешевле поиска в множестве и занимает 1 байт на клетку
+        visited = bytearray(grid.width * grid.height)
+        visited[root.index] = 1
 
-        # Шаг 6: Счетчик шагов для анимации/отладки
-        step = 0
-
-        # Шаг 7: Основной цикл алгоритма - продолжается, пока есть ячейки во фронте
+        # Шаг 4: Основной цикл алгоритма - продолжается, пока есть ячейки во фронте
         while frontier:
-            # Шаг 7a: Случайным образом выбираем индекс ячейки во фронте
+            # Шаг 4a: Случайным образом выбираем индекс ячейки во фронте
             # Это ключевое отличие от стандартного алгоритма Прима:
             # мы выбираем не ближайшую, а случайную ячейку из фронта
-            idx = self._random.randrange(len(frontier))
+            idx = int(rand() * len(frontier))
 
-            # Шаг 7b: Извлекаем ячейку по случайному индексу
-            cell = frontier.pop(idx)
+            # Шаг 4b: Извлекаем ячейку по случайному индексу за O(1):
+            # ставим на ее место последний элемент и снимаем хвост списка.
+            # Порядок фронта не важен - индекс все равно выбирается случайно
+            cell = frontier[idx]
+            frontier[idx] = frontier[-1]
+            frontier.pop()
 
-            # Шаг 7c: Добавляем ячейку в список посещенных по порядку
+            # Шаг 4c: Добавляем ячейку в список посещенных по порядку
             visit_order.append(cell)
 
-            # Шаг 7d: Если есть рекордер, записываем активацию ячейки
-            if recorder:
-                recorder.record(
-                    "generate",
-                    "activate",
-                    cell=list(cell.coords),
-                    step=step,
-                )
-            step += 1
-
-            # Шаг 8: Исследуем всех соседей текущей ячейки
+            # Шаг 5: Исследуем всех соседей текущей ячейки
             for neighbor in grid.neighbors(cell):
-                # Шаг 8a: Если сосед уже посещен, пропускаем его
-                if neighbor.coords in visited:
+                # Шаг 5a: Если сосед уже посещен, пропускаем его
+                if visited[neighbor.index]:
                     continue
 
-                # Шаг 8b: Помечаем соседа как посещенного
-                visited.add(neighbor.coords)
+                # Шаг 5b: Помечаем соседа как посещенного
+                visited[neighbor.index] = 1
 
-                # Шаг 8c: Убираем стену между текущей ячейкой и соседом
+                # Шаг 5c: Убираем стену между текущей ячейкой и соседом
                 # Это создает проход в лабиринте
                 grid.link(cell, neighbor)
 
-                # Шаг 8d: Устанавливаем родительскую связь в дереве
+                # Шаг 5d: Устанавливаем родительскую связь в дереве
                 # Текущая ячейка становится родителем соседа
                 neighbor.parent = cell
 
-                # Шаг 8e: Добавляем соседа в список детей текущей ячейки
+                # Шаг 5e: Добавляем соседа в список детей текущей ячейки
                 cell.children.append(neighbor)
 
-                # Шаг 8f: Добавляем соседа во фронт
+                # Шаг 5f: Добавляем соседа во фронт
                 # Теперь эта ячейка будет рассмотрена на следующих итерациях
                 frontier.append(neighbor)
 
-                # Шаг 8g: Если есть рекордер, записываем создание связи
-                if recorder:
-                    recorder.record(
-                        "generate",
-                        "link",
-                        parent=list(cell.coords),
-                        child=list(neighbor.coords),
-                    )
+        return visit_order
 
-        # Шаг 9: Возвращаем результат - дерево лабиринта
-        # Содержит сетку, корень и порядок посещения ячеек
-        return MazeTree(grid=grid, root=root, visit_order=visit_order)
+    def _carve_recorded(
+        self,
+        grid: MazeGrid,
+        root: Cell,
+        recorder: AnimationRecorder,
+    ) -> List[Cell]:
+        """То же, что и ``_carve``, но с записью каждого шага в ``recorder``."""
+        visit_order: List[Cell] = []
+        frontier: List[Cell] = [root]
+        visited = bytearray(grid.width * grid.height)
+        visited[root.index] = 1
+        record = recorder.record
+        rand = self._random.random
+
+        # Счетчик шагов для анимации
+        step = 0
+
+        while frontier:
+            # Тот же вызов random(), что и в ``_carve``
+            idx = int(rand() * len(frontier))
+            cell = frontier[idx]
+            frontier[idx] = frontier[-1]
+            frontier.pop()
+            visit_order.append(cell)
+
+            # Записываем активацию ячейки
+            record("generate", "activate", cell=cell.coords, step=step)
+            step += 1
+
+            for neighbor in grid.neighbors(cell):
+                if visited[neighbor.index]:
+                    continue
+                visited[neighbor.index] = 1
+                grid.link(cell, neighbor)
+                neighbor.parent = cell
+                cell.children.append(neighbor)
+                frontier.append(neighbor)
+
+                # Записываем создание связи
+                record(
+                    "generate",
+                    "link",
+                    parent=cell.coords,
+                    child=neighbor.coords,
+                )
+
+        return visit_order
@@ -6,58 +6,115 @@
 from __future__ import annotations  # Для отложенных аннотаций типов
 
 from dataclasses import dataclass, field
-from typing import Iterable, Iterator, List, Sequence, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 
 
 # Тип для представления смещений к соседям
 Neighbors = Tuple[int, int]
 
+# Смещения для ортогональных соседей: восток, запад, юг, север
+OFFSETS: Sequence[Neighbors] = ((1, 0), (-1, 0), (0, 1), (0, -1))
 
-@dataclass(slots=True)  # Используем slots для оптимизации памяти
+# Битовые флаги направлений в маске связей (4 бита на клетку)
+EAST, WEST, SOUTH, NORTH = 1, 2, 4, 8
+
+# Направления в порядке OFFSETS, в этом же порядке перечисляются связи
+DIRECTIONS: Sequence[int] = (EAST, WEST, SOUTH, NORTH)
+
+# Смещение (dx, dy) от клетки a к клетке b -> (бит для a, бит для b)
+_LINK_BITS = {
+    (1, 0): (EAST, WEST),
+    (-1, 0): (WEST, EAST),
+    (0, 1): (SOUTH, NORTH),
+    (0, -1): (NORTH, SOUTH),
+}
+
+
+@dataclass(slots=True, eq=False)  # slots для памяти, eq=False - хэш по идентичности
 class Cell:
     """
     Представляет одну клетку лабиринта.
     
     Клетка может иметь связи (проходы) с ортогональными соседями.
+    Сами связи хранятся не в клетке, а в байтовой маске сетки
+    (``MazeGrid.link_mask``), клетка лишь ссылается на свою сетку.
     Также поддерживает структуру дерева для хранения путей.
+
+    Каждая клетка существует в сетке в единственном экземпляре, поэтому
+    сравнение и хэширование выполняются по идентичности объекта - без
+    построения кортежа координат при каждом обращении к словарю.
     
     Атрибуты:
         x, y: Координаты клетки в сетке
-        links: Словарь связанных соседей и весов связей
+        coords: Кортеж (x, y), вычисляется один раз при создании клетки
+        links: Связанные соседи и веса связей (только чтение, строится по маске)
         parent: Родительская клетка в дереве обхода
         children: Дочерние клетки в дереве обхода
         _depth_cache: Кэшированная глубина в дереве
+        index: Индекс клетки в плоском хранилище сетки (x * height + y)
+        _grid: Сетка, которой принадлежит клетка
     """
 
     x: int
     y: int
-    links: dict["Cell", int] = field(default_factory=dict)  # Граф связей
     parent: "Cell | None" = None  # Для построения деревьев
     children: List["Cell"] = field(default_factory=list)  # Для иерархии
     _depth_cache: int | None = field(default=None, init=False, repr=False)  # Оптимизация
+    index: int = field(default=-1, init=False, repr=False)  # Выставляется сеткой
+    coords: Tuple[int, int] = field(init=False, repr=False)  # Кэш кортежа (x, y)
+    _grid: "MazeGrid | None" = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Координаты клетки не меняются, поэтому кортеж создается один раз,
+        # а не при каждом обращении к coords
+        self.coords = (self.x, self.y)
 
     @property
-    def coords(self) -> Tuple[int, int]:
-        """Возвращает координаты клетки в виде кортежа (x, y)."""
-        return self.x, self.y
+    def links(self) -> Mapping["Cell", int]:
+        """
+        Возвращает связанных соседей и веса связей.
+
+        Отображение собирается заново из маски сетки при каждом обращении
+        и доступно только для чтения: попытка изменить его вызывает
+        TypeError. Для изменения связей используйте link/unlink.
+        """
+        grid = self._grid
+        if grid is None:
+            return MappingProxyType({})
+        return MappingProxyType(
+            {neighbor: grid.weight(self, neighbor) for neighbor in grid.linked(self)}
+        )
 
     def depth(self) -> int:
         """
         Вычисляет глубину клетки в дереве (расстояние от корня).
         
-        Использует мемоизацию для оптимизации повторных вычислений.
+        Обходит цепочку родителей циклом, а не рекурсией, поэтому длинные
+        "змейки" не упираются в лимит рекурсии. Глубина запоминается у каждой
+        клетки на пройденном участке цепочки.
         """
         if self._depth_cache is not None:
             return self._depth_cache
-        
-        # Если нет родителя, это корневая клетка (глубина 0)
-        if not self.parent:
-            self._depth_cache = 0
-        else:
-            # Глубина = глубина родителя + 1
-            self._depth_cache = self.parent.depth() + 1
-        
-        return self._depth_cache
+
+        # Поднимаемся к корню или к ближайшему предку с известной глубиной
+        chain: List[Cell] = []
+        cursor: Cell = self
+        while cursor._depth_cache is None and cursor.parent is not None:
+            chain.append(cursor)
+            cursor = cursor.parent
+
+        # У корня (клетки без родителя) глубина 0
+        if cursor._depth_cache is None:
+            cursor._depth_cache = 0
+        depth = cursor._depth_cache
+
+        # Спускаемся обратно, заполняя кэш: глубина = глубина родителя + 1
+        for cell in reversed(chain):
+            depth += 1
+            cell._depth_cache = depth
+
+        return depth
 
     def link(self, other: "Cell", weight: int = 1) -> None:
         """
@@ -67,13 +124,11 @@ class Cell:
             other: Клетка для связи
             weight: Вес связи (может использоваться для взвешенных графов)
         """
-        self.links[other] = weight
-        other.links[self] = weight
+        self._owner().link(self, other, weight)
 
     def unlink(self, other: "Cell") -> None:
         """Удаляет связь между двумя клетками."""
-        self.links.pop(other, None)
-        other.links.pop(self, None)
+        self._owner().unlink(self, other)
 
     def reset_links(self) -> None:
         """
@@ -81,29 +136,22 @@ class Cell:
         
         Используется при перегенерации лабиринта.
         """
-        # Удаляем ссылки на текущую клетку у всех соседей
-        for neighbor in list(self.links.keys()):
-            neighbor.links.pop(self, None)
+        # Удаляем связи текущей клетки у всех соседей
+        grid = self._grid
+        if grid is not None:
+            for neighbor in grid.linked(self):
+                grid.unlink(self, neighbor)
         
         # Очищаем все атрибуты
-        self.links.clear()
         self.parent = None
         self.children.clear()
         self._depth_cache = None
 
-    def __hash__(self) -> int:
-        """
-        Определяет хэш-функцию для использования Cell как ключа словаря.
-        
-        Хэшируем по координатам, так как они уникальны для каждой клетки.
-        """
-        return hash((self.x, self.y))
-
-    def __eq__(self, other: object) -> bool:
-        """Сравнивает две клетки по координатам."""
-        if not isinstance(other, Cell):
-            return NotImplemented
-        return (self.x, self.y) == (other.x, other.y)
+    def _owner(self) -> "MazeGrid":
+        """Возвращает сетку клетки или сообщает, что клетка вне сетки."""
+        if self._grid is None:
+            raise ValueError(f"Клетка {self.coords} не принадлежит ни одной сетке.")
+        return self._grid
 
 
 class MazeGrid:
@@ -114,6 +162,18 @@ class MazeGrid:
     поиск соседей, управление связями.
     """
 
+    # Фиксированный набор атрибутов: без __dict__ у экземпляра
+    # обращения к width/height/_cells в горячих циклах дешевле
+    __slots__ = (
+        "width",
+        "height",
+        "_cells",
+        "_neighbors",
+        "link_mask",
+        "_weights",
+        "_mask_deltas",
+    )
+
     def __init__(self, width: int, height: int):
         """Инициализирует сетку заданного размера."""
         if width <= 0 or height <= 0:
@@ -122,11 +182,33 @@ class MazeGrid:
         self.width = int(width)
         self.height = int(height)
         
-        # Создаем двумерный список клеток
-        # Обратите внимание: первый индекс - x (столбец), второй - y (строка)
-        self._cells: List[List[Cell]] = [
-            [Cell(x, y) for y in range(self.height)]
-            for x in range(self.width)
+        # Храним клетки в одном плоском списке: клетка (x, y) лежит по
+        # индексу x * height + y, то есть порядок обхода - по столбцам
+        self._cells: List[Cell] = [
+            Cell(x, y) for x in range(self.width) for y in range(self.height)
+        ]
+        for idx, cell in enumerate(self._cells):
+            cell.index = idx
+            cell._grid = self
+
+        # Таблица соседей строится лениво, при первом вызове neighbors():
+        # генератору двоичного дерева и решателям она не нужна
+        self._neighbors: List[Tuple[Cell, ...]] | None = None
+
+        # Маска проходов: по байту на клетку, биты EAST/WEST/SOUTH/NORTH.
+        # Это единственное хранилище связей - словарей в клетках нет
+        self.link_mask = bytearray(len(self._cells))
+
+        # Веса связей хранятся разреженно: только отличные от 1,
+        # по ключу (меньший индекс, больший индекс)
+        self._weights: Dict[Tuple[int, int], int] = {}
+
+        # Для каждого значения маски (0..15) - смещения индексов связанных
+        # соседей в плоском списке: восток/запад - на высоту столбца, юг/север - на 1
+        deltas = {EAST: self.height, WEST: -self.height, SOUTH: 1, NORTH: -1}
+        self._mask_deltas: List[Tuple[int, ...]] = [
+            tuple(deltas[bit] for bit in DIRECTIONS if mask & bit)
+            for mask in range(16)
         ]
 
     def __iter__(self) -> Iterator[Cell]:
@@ -135,8 +217,7 @@ class MazeGrid:
         
         Позволяет использовать: for cell in grid: ...
         """
-        for column in self._cells:
-            yield from column  # Генератор для эффективности
+        return iter(self._cells)
 
     def contains(self, x: int, y: int) -> bool:
         """Проверяет, находятся ли координаты в пределах сетки."""
@@ -149,9 +230,10 @@ class MazeGrid:
         Raises:
             IndexError: Если координаты вне границ сетки.
         """
-        if not self.contains(x, y):
+        # Проверка границ встроена, чтобы не платить за вызов contains
+        if not (0 <= x < self.width and 0 <= y < self.height):
             raise IndexError(f"Клетка ({x}, {y}) выходит за границы лабиринта.")
-        return self._cells[x][y]
+        return self._cells[x * self.height + y]
 
     def neighbor_coords(self, cell: Cell) -> Iterable[Tuple[int, int]]:
         """
@@ -160,27 +242,133 @@ class MazeGrid:
         Ортогональные соседи: вверх, вниз, влево, вправо.
         Диагональные соседи не учитываются в стандартном лабиринте.
         """
-        # Смещения для ортогональных соседей
-        offsets: Sequence[Neighbors] = ((1, 0), (-1, 0), (0, 1), (0, -1))
-        
-        for dx, dy in offsets:
-            nx, ny = cell.x + dx, cell.y + dy
-            if self.contains(nx, ny):
-                yield nx, ny
+        for neighbor in self.neighbors(cell):
+            yield neighbor.coords
 
-    def neighbors(self, cell: Cell) -> Iterable[Cell]:
-        """Генерирует объекты всех ортогональных соседей клетки."""
-        for x, y in self.neighbor_coords(cell):
-            yield self.cell(x, y)
+    def neighbors(self, cell: Cell) -> Tuple[Cell, ...]:
+        """
+        Возвращает всех ортогональных соседей клетки.
+
+        Кортеж берется из таблицы, построенной при первом вызове, поэтому
+        вызов не выполняет ни проверок границ, ни создания генератора.
+        """
+        table = self._neighbors
+        if table is None:
+            table = self._neighbors = self._build_neighbors()
+        return table[cell.index]
+
+    def cell_at(self, index: int) -> Cell:
+        """Возвращает клетку по индексу в плоском хранилище (x * height + y)."""
+        return self._cells[index]
+
+    @property
+    def mask_deltas(self) -> Sequence[Tuple[int, ...]]:
+        """
+        Смещения индексов связанных соседей для каждого значения маски (0..15).
+
+        Соседи клетки ``i`` по проходам: ``i + d`` для ``d`` в
+        ``mask_deltas[link_mask[i]]`` - в порядке восток, запад, юг, север.
+        """
+        return self._mask_deltas
+
+    def _build_neighbors(self) -> List[Tuple[Cell, ...]]:
+        """
+        Строит таблицу соседей: для каждой клетки кортеж из не более чем
+        четырех соседей в порядке OFFSETS (восток, запад, юг, север).
+
+        Клетки хранятся по столбцам, поэтому соседи всего столбца - это срезы
+        плоского списка: восточные и западные - соседние столбцы, южные и
+        северные - тот же столбец со сдвигом на 1. Кортежи собираются через
+        zip без проверок границ; отдельно обрабатываются только верхняя и
+        нижняя клетки столбца.
+        """
+        cells = self._cells
+        width, height = self.width, self.height
+        table: List[Tuple[Cell, ...]] = []
+        for x in range(width):
+            base = x * height
+            column = cells[base : base + height]
+            sides: List[List[Cell]] = []
+            if x + 1 < width:
+                sides.append(cells[base + height : base + 2 * height])
+            if x > 0:
+                sides.append(cells[base - height : base])
+            if height == 1:
+                table.append(tuple(side[0] for side in sides))
+                continue
+            table.append(tuple(side[0] for side in sides) + (column[1],))
+            table.extend(zip(*(side[1:-1] for side in sides), column[2:], column[:-2]))
+            table.append(tuple(side[-1] for side in sides) + (column[-2],))
+        return table
+
+    def linked(self, cell: Cell) -> Tuple[Cell, ...]:
+        """
+        Возвращает соседей, с которыми клетка соединена проходом.
+
+        Читает один байт маски и берет готовые смещения для этого значения;
+        порядок соседей - восток, запад, юг, север.
+        """
+        idx = cell.index
+        cells = self._cells
+        return tuple(cells[idx + delta] for delta in self._mask_deltas[self.link_mask[idx]])
+
+    def weight(self, a: Cell, b: Cell) -> int:
+        """Возвращает вес связи между клетками (по умолчанию 1)."""
+        if not self._weights:
+            return 1
+        key = (a.index, b.index) if a.index < b.index else (b.index, a.index)
+        return self._weights.get(key, 1)
 
     def link(self, a: Cell, b: Cell, weight: int = 1) -> None:
-        """Создает связь между двумя клетками (прокладывает проход)."""
-        a.link(b, weight)
+        """
+        Создает связь между двумя клетками (прокладывает проход).
+
+        Выставляет биты направлений в ``link_mask`` у обеих клеток.
+
+        Raises:
+            ValueError: Если клетки не являются ортогональными соседями.
+        """
+        bits = self._link_bits(a, b)
+        mask = self.link_mask
+        mask[a.index] |= bits[0]
+        mask[b.index] |= bits[1]
+        if weight != 1:
+            key = (a.index, b.index) if a.index < b.index else (b.index, a.index)
+            self._weights[key] = weight
+        elif self._weights:
+            key = (a.index, b.index) if a.index < b.index else (b.index, a.index)
+            self._weights.pop(key, None)
+
+    def unlink(self, a: Cell, b: Cell) -> None:
+        """Удаляет проход между двумя клетками."""
+        bits = self._link_bits(a, b)
+        mask = self.link_mask
+        mask[a.index] &= ~bits[0]
+        mask[b.index] &= ~bits[1]
+        if self._weights:
+            key = (a.index, b.index) if a.index < b.index else (b.index, a.index)
+            self._weights.pop(key, None)
 
     def reset(self) -> None:
         """Сбрасывает все связи в лабиринте."""
-        for cell in self:
-            cell.reset_links()
+        self.link_mask[:] = bytes(len(self._cells))
+        self._weights.clear()
+        for cell in self._cells:
+            cell.parent = None
+            cell.children.clear()
+            cell._depth_cache = None
+
+    def _link_bits(self, a: Cell, b: Cell) -> Tuple[int, int]:
+        """
+        Возвращает биты направлений для пары соседних клеток этой сетки.
+
+        Raises:
+            ValueError: Если клетки не являются ортогональными соседями.
+        """
+        bits = _LINK_BITS.get((b.x - a.x, b.y - a.y))
+        if bits is None or a._grid is not self or b._grid is not self:
+            raise ValueError(f"Клетки {a.coords} и {b.coords} не являются соседями.")
+        return bits
 
 
 @dataclass(slots=True)
@@ -205,14 +393,15 @@ class MazeTree:
         Returns:
             Список клеток от корня к цели (включительно).
         """
-        path: List[Cell] = []
+        # Длина пути известна заранее (глубина + 1), поэтому список
+        # выделяется один раз и заполняется с конца - без разворота
+        length = target.depth() + 1
+        path: List[Cell] = [target] * length
         cursor: Cell | None = target
         
         # Идем от цели к корню по родительским ссылкам
-        while cursor:
-            path.append(cursor)
+        for index in range(length - 1, -1, -1):
+            path[index] = cursor
             cursor = cursor.parent
         
-        # Переворачиваем, чтобы получить путь от корня к цели
-        return list(reversed(path))
-
+        return path
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from ..grid import Cell, MazeTree
+from ..grid import EAST, SOUTH, Cell, MazeTree
 from ..solvers.results import MazeSolution
 
+_OPEN = ord(" ")
+
 
 class AsciiRenderer:
     """Render mazes as monospaced strings."""
@@ -19,46 +21,59 @@ class AsciiRenderer:
         start_token: str = "S",
         target_token: str = "T",
     ) -> str:
-        width = tree.grid.width * 2 + 1
-        height = tree.grid.height * 2 + 1
-        canvas = [["#"] * width for _ in range(height)]
-
-        def carve(cell: Cell) -> None:
-            row = cell.y * 2 + 1
-            col = cell.x * 2 + 1
-            canvas[row][col] = " "
-            for neighbor in cell.links:
-                mid_row = cell.y + neighbor.y + 1
-                mid_col = cell.x + neighbor.x + 1
-                canvas[mid_row][mid_col] = " "
-
-        for cell in tree.grid:
-            carve(cell)
+        start_byte = self._token_byte(start_token)
+        target_byte = self._token_byte(target_token)
+
+        grid = tree.grid
+        width = grid.width * 2 + 1
+        height = grid.height * 2 + 1
+        # One flat byte buffer; every row is followed by a newline byte.
+        stride = width + 1
+        canvas = bytearray((b"#" * width + b"\n") * height)
+
+        # Each passage is carved once, from its west/north end, by reading
+        # the EAST and SOUTH bits of the grid's link mask.
+        link_mask = grid.link_mask
+        idx = 0
+        for x in range(grid.width):
+            pos = stride + x * 2 + 1
+            for _ in range(grid.height):
+                mask = link_mask[idx]
+                canvas[pos] = _OPEN
+                if mask & EAST:
+                    canvas[pos + 1] = _OPEN
+                if mask & SOUTH:
+                    canvas[pos + stride] = _OPEN
+                pos += 2 * stride
+                idx += 1
 
         if solution and solution.path:
-            self._mark_path(canvas, solution.path, token="*")
+            self._mark_path(canvas, stride, solution.path, token=ord("*"))
 
-        start_row = tree.root.y * 2 + 1
-        start_col = tree.root.x * 2 + 1
-        canvas[start_row][start_col] = start_token
+        canvas[self._offset(stride, tree.root)] = start_byte
 
         if solution and solution.path:
-            target_cell = solution.path[-1]
-            row = target_cell.y * 2 + 1
-            col = target_cell.x * 2 + 1
-            canvas[row][col] = target_token
+            canvas[self._offset(stride, solution.path[-1])] = target_byte
 
-        return "\n".join("".join(row) for row in canvas)
+        del canvas[-1]  # no trailing newline after the last row
+        return canvas.decode("ascii")
 
-    def _mark_path(self, canvas: list[list[str]], path: Iterable[Cell], token: str) -> None:
+    def _mark_path(self, canvas: bytearray, stride: int, path: Iterable[Cell], token: int) -> None:
         prev: Cell | None = None
         for cell in path:
-            row = cell.y * 2 + 1
-            col = cell.x * 2 + 1
-            canvas[row][col] = token
+            canvas[self._offset(stride, cell)] = token
             if prev:
                 mid_row = cell.y + prev.y + 1
                 mid_col = cell.x + prev.x + 1
-                canvas[mid_row][mid_col] = token
+                canvas[mid_row * stride + mid_col] = token
             prev = cell
 
+    @staticmethod
+    def _offset(stride: int, cell: Cell) -> int:
+        return (cell.y * 2 + 1) * stride + cell.x * 2 + 1
+
+    @staticmethod
+    def _token_byte(token: str) -> int:
+        if len(token) != 1 or not token.isascii():
+            raise ValueError(f"Tokens must be single ASCII characters, got {token!r}.")
+        return ord(token)
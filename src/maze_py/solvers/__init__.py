@@ -1,11 +1,13 @@
 """Solver exports."""
 
+from .bidirectional import BidirectionalBFSSolver
 from .breadth_first import BreadthFirstSolver
-from .depth_first import DepthFirstSolver
+from .dfc import DepthFirstSolver
 # from .dijkstra import DijkstraSolver
 from .results import MazeSolution, SolverStats
 
 __all__ = [
+    "BidirectionalBFSSolver",
     "BreadthFirstSolver",
      "DepthFirstSolver",
     # "DijkstraSolver",
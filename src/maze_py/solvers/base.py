@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from time import perf_counter
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 from ..animation import AnimationRecorder
-from ..grid import Cell, MazeTree
+from ..grid import Cell, MazeGrid, MazeTree
 from .results import MazeSolution, SolverStats
 
 
@@ -16,6 +16,11 @@ class MazeSolver(ABC):
 
     name: str = "solver"
 
+    def __init__(self, *, keep_explored: bool = False):
+        # The explored list is only for inspection; by default solvers just
+        # count expanded cells instead of keeping every one of them alive.
+        self._keep_explored = keep_explored
+
     def solve(
         self,
         tree: MazeTree,
@@ -24,11 +29,18 @@ class MazeSolver(ABC):
         recorder: AnimationRecorder | None = None,
     ) -> MazeSolution:
         start = perf_counter()
-        path, explored = self._traverse(tree, target, recorder=recorder)
+        result = self._traverse(tree, target, recorder=recorder)
         runtime_ms = (perf_counter() - start) * 1000
+        if len(result) == 2:
+            # Solvers written against the original (path, explored) contract
+            # still work: the expanded count is the length of their list.
+            path, explored = result
+            nodes_expanded = len(explored)
+        else:
+            path, nodes_expanded, explored = result
         stats = SolverStats(
             algorithm=self.name,
-            nodes_expanded=len(explored),
+            nodes_expanded=nodes_expanded,
             path_length=len(path) - 1 if path else 0,
             runtime_ms=runtime_ms,
         )
@@ -46,8 +58,13 @@ class MazeSolver(ABC):
         target: Tuple[int, int],
         *,
         recorder: AnimationRecorder | None = None,
-    ) -> Tuple[List[Cell], List[Cell]]:
-        """Return the visited order and final path."""
+    ) -> Tuple[List[Cell], int, List[Cell] | None] | Tuple[List[Cell], List[Cell]]:
+        """Return the final path, the number of expanded cells and, if
+        ``keep_explored`` was requested, the cells in visit order.
+
+        The original ``(path, explored)`` pair is still accepted; the
+        expanded count is then ``len(explored)``.
+        """
 
     def _build_path(
         self,
@@ -63,3 +80,19 @@ class MazeSolver(ABC):
             cursor = parents[cursor]
         return list(reversed(path))
 
+    def _build_index_path(
+        self,
+        grid: MazeGrid,
+        parents: Sequence[int],
+        target: int,
+    ) -> List[Cell]:
+        """Restore the path from an index parent array (-1 = unseen, root = itself)."""
+        if parents[target] < 0:
+            return []
+        cursor = target
+        indices: List[int] = [cursor]
+        while parents[cursor] != cursor:
+            cursor = parents[cursor]
+            indices.append(cursor)
+        cell_at = grid.cell_at
+        return [cell_at(idx) for idx in reversed(indices)]
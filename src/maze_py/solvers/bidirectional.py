@@ -0,0 +1,211 @@
+"""
+Модуль двунаправленного BFS-решателя лабиринтов.
+Поиск в ширину ведется одновременно от старта и от цели до встречи волн.
+"""
+
+from __future__ import annotations  # Для отложенных аннотаций типов
+
+from array import array  # Компактные массивы int для родителей и расстояний
+from typing import List, Tuple
+
+from ..animation import AnimationRecorder
+from ..grid import Cell, MazeGrid, MazeTree
+from .base import MazeSolver
+
+# Лучшая найденная встреча: (конец со стороны старта, конец со стороны цели, длина)
+Meeting = Tuple[int, int, int]
+
+
+class BidirectionalBFSSolver(MazeSolver):
+    """
+    Двунаправленный поиск в ширину.
+
+    Две волны BFS идут навстречу друг другу: от корня лабиринта и от цели.
+    На каждом шаге целиком раскрывается очередной уровень меньшего фронта.
+    Когда волны соприкасаются, путь склеивается из двух половин. Каждая волна
+    проходит примерно половину расстояния, поэтому исследуется заметно
+    меньше клеток, чем при обычном BFS от старта - особенно для далеких целей.
+    """
+
+    name = "bidirectional"  # Идентификатор алгоритма
+
+    def _traverse(
+        self,
+        tree: MazeTree,
+        target: Tuple[int, int],
+        *,
+        recorder: AnimationRecorder | None = None,
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
+        """
+        Основной метод обхода лабиринта двунаправленным BFS.
+
+        Returns:
+            Кортеж из (путь к цели, число исследованных клеток, список
+            исследованных клеток - только при ``keep_explored``)
+        """
+        grid = tree.grid
+        cell_at = grid.cell_at
+        root = tree.root.index
+        target_idx = grid.cell(*target).index
+
+        # Старт совпадает с целью - путь из одной клетки, поиск и массивы
+        # родителей не нужны
+        if root == target_idx:
+            if recorder is not None:
+                recorder.record("solve", "explore", cell=tree.root.coords, parent=None)
+                recorder.record("solve", "path", cells=[tree.root.coords])
+            return [tree.root], 1, [tree.root] if self._keep_explored else None
+
+        # Индексы исследованных клеток нужны только для анимации и для
+        # ``keep_explored``; иначе поиск лишь считает раскрытые клетки
+        explored_ids: List[int] | None = None
+        if recorder is not None or self._keep_explored:
+            explored_ids = []
+        path, expanded, parents_a, parents_b = self._search(
+            grid, root, target_idx, explored_ids
+        )
+
+        # Анимация восстанавливается после поиска: каждая исследованная клетка
+        # принадлежит ровно одной волне, а ее родитель после нахождения уже не
+        # меняется. Так в цикле поиска нет ни одной проверки записи анимации
+        if recorder is not None and explored_ids is not None:
+            record = recorder.record
+            for idx in explored_ids:
+                parent = parents_a[idx] if parents_a[idx] >= 0 else parents_b[idx]
+                record(
+                    "solve",
+                    "explore",
+                    cell=cell_at(idx).coords,
+                    parent=cell_at(parent).coords if parent != idx else None,
+                )
+            # Записываем финальный путь для анимации
+            if path:
+                record(
+                    "solve",
+                    "path",
+                    cells=[step.coords for step in path],
+                )
+
+        explored = None
+        if self._keep_explored and explored_ids is not None:
+            explored = [cell_at(idx) for idx in explored_ids]
+        return path, expanded, explored
+
+    def _search(
+        self,
+        grid: MazeGrid,
+        root: int,
+        target: int,
+        explored: List[int] | None,
+    ) -> Tuple[List[Cell], int, array, array]:
+        """
+        Ищет путь между различными индексами ``root`` и ``target``.
+
+        Если передан ``explored``, в него по порядку дописываются индексы
+        исследованных клеток.
+
+        Returns:
+            Путь, число исследованных клеток и массивы родителей волны
+            от старта и волны от цели
+        """
+        # 1. ИНИЦИАЛИЗАЦИЯ
+        # Для каждой волны: родители (-1 - клетка не найдена, у начала волны
+        # родитель - она сама) и расстояния от начала волны
+        size = len(grid.link_mask)
+        parents_a = array("i", [-1]) * size
+        parents_b = array("i", [-1]) * size
+        dist_a = array("i", [0]) * size
+        dist_b = array("i", [0]) * size
+        parents_a[root] = root
+        parents_b[target] = target
+        front_a: List[int] = [root]
+        front_b: List[int] = [target]
+
+        # 2. ОСНОВНОЙ ЦИКЛ
+        # Пока обе волны могут расти, раскрываем уровень меньшего фронта.
+        # Уровень раскрывается целиком, поэтому исследованные клетки
+        # считаются сразу по длине фронта
+        expanded = 0
+        meeting: Meeting | None = None
+        while front_a and front_b and meeting is None:
+            if len(front_a) <= len(front_b):
+                expanded += len(front_a)
+                if explored is not None:
+                    explored.extend(front_a)
+                front_a, found = self._expand(
+                    grid, front_a, parents_a, dist_a, parents_b, dist_b
+                )
+                meeting = found
+            else:
+                expanded += len(front_b)
+                if explored is not None:
+                    explored.extend(front_b)
+                front_b, found = self._expand(
+                    grid, front_b, parents_b, dist_b, parents_a, dist_a
+                )
+                # Концы встречи приходят со стороны волны от цели - меняем местами
+                meeting = (found[1], found[0], found[2]) if found else None
+
+        if meeting is None:
+            return [], expanded, parents_a, parents_b
+
+        # 3. СКЛЕЙКА ПУТИ
+        # Половина от старта восстанавливается с конца и разворачивается,
+        # половина от цели уже идет в нужном направлении
+        end_a, end_b, _ = meeting
+        indices: List[int] = []
+        cursor = end_a
+        while True:
+            indices.append(cursor)
+            if parents_a[cursor] == cursor:
+                break
+            cursor = parents_a[cursor]
+        indices.reverse()
+        cursor = end_b
+        while True:
+            indices.append(cursor)
+            if parents_b[cursor] == cursor:
+                break
+            cursor = parents_b[cursor]
+
+        cell_at = grid.cell_at
+        return [cell_at(idx) for idx in indices], expanded, parents_a, parents_b
+
+    @staticmethod
+    def _expand(
+        grid: MazeGrid,
+        front: List[int],
+        parents: array,
+        dist: array,
+        other_parents: array,
+        other_dist: array,
+    ) -> Tuple[List[int], Meeting | None]:
+        """
+        Раскрывает один уровень фронта.
+
+        Уровень раскрывается до конца даже после первой встречи: в лабиринте
+        с циклами кратчайший путь может пройти через другую клетку уровня.
+
+        Returns:
+            Следующий фронт и лучшая встреча (конец этой волны, конец
+            встречной волны, длина пути) или None.
+        """
+        link_mask = grid.link_mask
+        mask_deltas = grid.mask_deltas
+        next_front: List[int] = []
+        best: Meeting | None = None
+
+        for idx in front:
+            for delta in mask_deltas[link_mask[idx]]:
+                neighbor = idx + delta
+                # Сосед уже найден встречной волной - волны соприкоснулись
+                if other_parents[neighbor] >= 0:
+                    length = dist[idx] + 1 + other_dist[neighbor]
+                    if best is None or length < best[2]:
+                        best = (idx, neighbor, length)
+                elif parents[neighbor] < 0:
+                    parents[neighbor] = idx
+                    dist[neighbor] = dist[idx] + 1
+                    next_front.append(neighbor)
+
+        return next_front, best
@@ -5,8 +5,9 @@
 
 from __future__ import annotations  # Для отложенных аннотаций типов
 
-from collections import deque  # Используем deque для эффективной работы с очередью
-from typing import Deque, Dict, List, Tuple
+from array import array  # Компактный массив int для родителей клеток
+from itertools import islice
+from typing import List, Tuple
 
 from ..animation import AnimationRecorder
 from ..grid import Cell, MazeTree
@@ -31,7 +32,7 @@ class BreadthFirstSolver(MazeSolver):
         target: Tuple[int, int],
         *,
         recorder: AnimationRecorder | None = None,
-    ) -> Tuple[List[Cell], List[Cell]]:
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
         """
         Основной метод обхода лабиринта с использованием BFS.
         
@@ -41,73 +42,133 @@ class BreadthFirstSolver(MazeSolver):
             recorder: Опциональный рекордер для анимации процесса
             
         Returns:
-            Кортеж из (путь к цели, список всех исследованных клеток)
+            Кортеж из (путь к цели, число исследованных клеток, список
+            исследованных клеток - только при ``keep_explored``)
         """
         
+        # Вариант обхода выбирается один раз: без рекордера работает цикл,
+        # в котором нет ни одной проверки записи анимации
+        if recorder is None:
+            return self._traverse_fast(tree, target)
+        return self._traverse_recorded(tree, target, recorder)
+
+    def _traverse_fast(
+        self,
+        tree: MazeTree,
+        target: Tuple[int, int],
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
+        """BFS без записи анимации."""
+
         # 1. ИНИЦИАЛИЗАЦИЯ
-        # Получаем объект целевой клетки по координатам
-        target_cell = tree.grid.cell(*target)
+        # Обход идет по индексам клеток (x * height + y), а не по объектам Cell:
+        # соседи берутся из байтовой маски проходов сетки, а родители хранятся
+        # в целочисленном массиве. Объекты Cell нужны только для ответа
+        grid = tree.grid
+        link_mask = grid.link_mask
+        mask_deltas = grid.mask_deltas
         
-        # Создаем очередь для BFS. Используем deque для эффективных операций popleft()
-        # Начинаем с корневой клетки (входа в лабиринт)
-        queue: Deque[Cell] = deque([tree.root])
+        # Индексы корня (входа в лабиринт) и целевой клетки
+        root = tree.root.index
+        target_idx = grid.cell(*target).index
         
-        # Словарь для хранения родительских связей: клетка → её родитель
+        # Массив родителей: -1 - клетка еще не найдена, у корня родитель - он сам.
         # Это позволяет восстановить путь от цели к старту
-        parents: Dict[Cell, Cell | None] = {tree.root: None}
+        parents = array("i", [-1]) * len(link_mask)
+        parents[root] = root
         
-        # Список для отслеживания порядка исследования клеток (для визуализации)
-        explored: List[Cell] = []
+        # Очередь BFS - обычный список с указателем на голову: каждая клетка
+        # попадает в очередь один раз, поэтому удалять из начала не нужно.
+        # Заодно голова очереди - это порядок исследования клеток
+        queue: List[int] = [root]
+        head = 0
 
         # 2. ОСНОВНОЙ ЦИКЛ BFS
         # Продолжаем, пока есть клетки для исследования
-        while queue:
+        while head < len(queue):
             # Извлекаем первую клетку из очереди (FIFO)
             # Это ключевое отличие BFS от DFS (который использует стек)
-            cell = queue.popleft()
-            
-            # Добавляем клетку в список исследованных
-            explored.append(cell)
-            
-            # Если включена запись анимации, фиксируем текущее состояние
-            if recorder:
-                recorder.record(
-                    "solve",
-                    "explore",
-                    cell=list(cell.coords),
-                    parent=list(parents[cell].coords) if parents[cell] else None,
-                )
+            idx = queue[head]
+            head += 1
             
             # 3. ПРОВЕРКА ЦЕЛИ
             # Если достигли целевой клетки, завершаем поиск
             # В BFS это гарантированно будет кратчайший путь
-            if cell is target_cell:
+            if idx == target_idx:
                 break
             
             # 4. ИССЛЕДОВАНИЕ СОСЕДЕЙ
             # Проходим по всем связанным соседям текущей клетки
             # В контексте лабиринта - это проходы без стен
-            for neighbor in cell.links:
-                # Пропускаем уже посещенных соседей (они уже есть в словаре parents)
-                if neighbor in parents:
-                    continue
-                
-                # Запоминаем родителя для соседа (текущую клетку)
-                parents[neighbor] = cell
-                
-                # Добавляем соседа в конец очереди для дальнейшего исследования
-                queue.append(neighbor)
+            for delta in mask_deltas[link_mask[idx]]:
+                neighbor = idx + delta
+                # Пропускаем уже найденных соседей (у них есть родитель)
+                if parents[neighbor] < 0:
+                    # Запоминаем родителя и ставим соседа в конец очереди
+                    parents[neighbor] = idx
+                    queue.append(neighbor)
 
         # 5. ВОССТАНОВЛЕНИЕ ПУТИ
-        # Строим путь от цели к старту, используя словарь родителей
-        path = self._build_path(parents, target_cell)
-        
+        # Строим путь от цели к старту по массиву родителей.
+        # Исследованы ровно клетки до головы очереди - их число и есть head,
+        # а список клеток собирается, только если его попросили
+        explored = None
+        if self._keep_explored:
+            cell_at = grid.cell_at
+            explored = [cell_at(idx) for idx in islice(queue, head)]
+        return self._build_index_path(grid, parents, target_idx), head, explored
+
+    def _traverse_recorded(
+        self,
+        tree: MazeTree,
+        target: Tuple[int, int],
+        recorder: AnimationRecorder,
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
+        """То же, что и ``_traverse_fast``, но с записью каждого шага в ``recorder``."""
+        grid = tree.grid
+        link_mask = grid.link_mask
+        mask_deltas = grid.mask_deltas
+        cell_at = grid.cell_at
+        root = tree.root.index
+        target_idx = grid.cell(*target).index
+        parents = array("i", [-1]) * len(link_mask)
+        parents[root] = root
+        queue: List[int] = [root]
+        head = 0
+        record = recorder.record
+
+        while head < len(queue):
+            idx = queue[head]
+            head += 1
+
+            # Фиксируем текущее состояние для анимации
+            parent = parents[idx]
+            record(
+                "solve",
+                "explore",
+                cell=cell_at(idx).coords,
+                parent=cell_at(parent).coords if parent != idx else None,
+            )
+
+            if idx == target_idx:
+                break
+
+            for delta in mask_deltas[link_mask[idx]]:
+                neighbor = idx + delta
+                if parents[neighbor] < 0:
+                    parents[neighbor] = idx
+                    queue.append(neighbor)
+
+        explored = None
+        if self._keep_explored:
+            explored = [cell_at(idx) for idx in islice(queue, head)]
+        path = self._build_index_path(grid, parents, target_idx)
+
         # Записываем финальный путь для анимации
-        if path and recorder:
-            recorder.record(
+        if path:
+            record(
                 "solve",
                 "path",
-                cells=[list(step.coords) for step in path],
+                cells=[step.coords for step in path],
             )
-        
-        return path, explored
\ No newline at end of file
+
+        return path, head, explored
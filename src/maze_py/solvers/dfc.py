@@ -1,5 +1,6 @@
 from __future__ import annotations 
-from typing import List, Dict, Tuple
+from array import array
+from typing import List, Tuple
 from ..animation import AnimationRecorder
 from ..grid import Cell, MazeTree
 from .base import MazeSolver
@@ -14,37 +15,113 @@ class DepthFirstSolver(MazeSolver):
         target: Tuple[int, int],
         *,
         recorder: AnimationRecorder | None = None,
-    ) -> Tuple[List[Cell], List[Cell]]:
-        target_cell = tree.grid.cell(*target)
-        stack: List[Cell] = [tree.root]
-        parents: Dict[Cell, Cell | None] = {tree.root: None}
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
+        if recorder is not None:
+            return self._traverse_recorded(tree, target, recorder)
+        if self._keep_explored:
+            return self._traverse_explored(tree, target)
+        return self._traverse_fast(tree, target)
+
+    def _traverse_fast(
+        self,
+        tree: MazeTree,
+        target: Tuple[int, int],
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
+        grid = tree.grid
+        link_mask = grid.link_mask
+        mask_deltas = grid.mask_deltas
+        root = tree.root.index
+        target_idx = grid.cell(*target).index
+        parents = array("i", [-1]) * len(link_mask)
+        parents[root] = root
+        stack: List[int] = [root]
+        while stack:
+            idx = stack.pop()
+            if idx == target_idx:
+                break
+            for delta in mask_deltas[link_mask[idx]]:
+                neighbor = idx + delta
+                if parents[neighbor] < 0:
+                    parents[neighbor] = idx
+                    stack.append(neighbor)
+        # Each found cell is pushed exactly once, so the expanded ones are
+        # the found cells (those with a parent) minus what is left on the stack
+        expanded = len(parents) - parents.count(-1) - len(stack)
+        return self._build_index_path(grid, parents, target_idx), expanded, None
+
+    def _traverse_explored(
+        self,
+        tree: MazeTree,
+        target: Tuple[int, int],
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
+        grid = tree.grid
+        link_mask = grid.link_mask
+        mask_deltas = grid.mask_deltas
+        root = tree.root.index
+        target_idx = grid.cell(*target).index
+        parents = array("i", [-1]) * len(link_mask)
+        parents[root] = root
+        stack: List[int] = [root]
+        explored_ids: List[int] = []
+        while stack:
+            idx = stack.pop()
+            
+            explored_ids.append(idx)
+            
+            if idx == target_idx:
+                break
+            for delta in mask_deltas[link_mask[idx]]:
+                neighbor = idx + delta
+                if parents[neighbor] < 0:
+                    parents[neighbor] = idx
+                    stack.append(neighbor)
+        cell_at = grid.cell_at
+        explored = [cell_at(idx) for idx in explored_ids]
+        return self._build_index_path(grid, parents, target_idx), len(explored), explored
+
+    def _traverse_recorded(
+        self,
+        tree: MazeTree,
+        target: Tuple[int, int],
+        recorder: AnimationRecorder,
+    ) -> Tuple[List[Cell], int, List[Cell] | None]:
+        grid = tree.grid
+        link_mask = grid.link_mask
+        mask_deltas = grid.mask_deltas
+        cell_at = grid.cell_at
+        root = tree.root.index
+        target_idx = grid.cell(*target).index
+        parents = array("i", [-1]) * len(link_mask)
+        parents[root] = root
+        stack: List[int] = [root]
         explored: List[Cell] = []
+        record = recorder.record
         while stack:
-            cell = stack.pop()
+            idx = stack.pop()
+            cell = cell_at(idx)
             
             explored.append(cell)
             
-            if recorder:
-                recorder.record(
-                    "solve",
-                    "explore",
-                    cell=list(cell.coords),
-                    parent=list(parents[cell].coords) if parents[cell] else None,
-                )
-            if cell is target_cell:
+            parent = parents[idx]
+            record(
+                "solve",
+                "explore",
+                cell=cell.coords,
+                parent=cell_at(parent).coords if parent != idx else None,
+            )
+            if idx == target_idx:
                 break
-            for neighbor in cell.links:
-                if neighbor in parents:
-                    continue
-                
-                parents[neighbor] = cell
-                stack.append(neighbor)
-        path = self._build_path(parents, target_cell)
+            for delta in mask_deltas[link_mask[idx]]:
+                neighbor = idx + delta
+                if parents[neighbor] < 0:
+                    parents[neighbor] = idx
+                    stack.append(neighbor)
+        path = self._build_index_path(grid, parents, target_idx)
 
-        if path and recorder:
-            recorder.record(
+        if path:
+            record(
                 "solve",
                 "path",
-                cells=[list(step.coords) for step in path],
+                cells=[step.coords for step in path],
             )
-        return path, explored
+        return path, len(explored), explored if self._keep_explored else None
@@ -19,7 +19,7 @@ class SolverStats:
 @dataclass(slots=True)
 class MazeSolution:
     path: List[Cell]
-    explored: List[Cell]
+    explored: List[Cell] | None
     found: bool
     stats: SolverStats
 
@@ -0,0 +1,70 @@
+"""Проверки экспорта анимации в JSON."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from maze_py import AnimationRecorder, BreadthFirstSolver, MazeGrid, SpanningTreeGenerator
+from maze_py import exporters
+
+START, TARGET = (0, 0), (4, 3)
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def backend(request, monkeypatch):
+    """Запускает тест и со стандартным json, и с orjson (если он установлен)."""
+    if request.param == "orjson":
+        monkeypatch.setattr(exporters, "orjson", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(exporters, "orjson", None)
+    return request.param
+
+
+def _export(path: Path, recorder: AnimationRecorder, *, record: bool = True) -> tuple:
+    grid = MazeGrid(5, 4)
+    run_recorder = recorder if record else None
+    tree = SpanningTreeGenerator(seed=1).generate(grid, START, recorder=run_recorder)
+    solution = BreadthFirstSolver().solve(tree, TARGET, recorder=run_recorder)
+    written = exporters.write_animation_package(
+        path, grid, tree, solution, recorder, start=START, target=TARGET
+    )
+    header = {
+        "grid": {"width": 5, "height": 4},
+        "start": list(START),
+        "target": list(TARGET),
+        "found": solution.found,
+    }
+    return written, header
+
+
+@pytest.mark.parametrize("scenario", ["run", "no_payload", "empty"])
+def test_package_round_trips(tmp_path, backend, scenario):
+    recorder = AnimationRecorder()
+    if scenario == "no_payload":
+        # Событие без полей кодируется как {"phase": ..., "event": ...}
+        recorder.record("solve", "done")
+    path, header = _export(tmp_path / "run.json", recorder, record=scenario != "empty")
+
+    with path.open(encoding="utf-8") as handle:
+        document = json.load(handle)
+
+    # Кортежи в событиях после JSON становятся списками
+    events = json.loads(json.dumps(recorder.to_serializable()))
+    assert document == {**header, "events": events}
+    if scenario == "empty":
+        assert document["events"] == []
+
+
+def test_orjson_output_matches_stdlib(tmp_path, monkeypatch):
+    fast = pytest.importorskip("orjson")
+    recorder = AnimationRecorder()
+
+    monkeypatch.setattr(exporters, "orjson", fast)
+    fast_path, _ = _export(tmp_path / "fast.json", recorder)
+    monkeypatch.setattr(exporters, "orjson", None)
+    plain_path, _ = _export(tmp_path / "plain.json", AnimationRecorder())
+
+    assert fast_path.read_bytes() == plain_path.read_bytes()
@@ -0,0 +1,83 @@
+"""Проверки генераторов лабиринтов."""
+
+from __future__ import annotations
+
+import pytest
+
+from maze_py import (
+    AnimationRecorder,
+    BinaryTreeGenerator,
+    MazeGrid,
+    RandomGrowthGenerator,
+    SpanningTreeGenerator,
+)
+from maze_py.generators import ParallelSpanningTreeGenerator, parallel_spanning_tree
+
+GENERATORS = [
+    lambda seed: SpanningTreeGenerator(seed=seed),
+    lambda seed: RandomGrowthGenerator(seed=seed),
+    lambda seed: BinaryTreeGenerator(seed=seed),
+    lambda seed: ParallelSpanningTreeGenerator(seed=seed, tiles=2, workers=1),
+]
+
+SIZES = [(1, 1), (1, 6), (6, 1), (7, 5), (16, 16)]
+
+
+def _snapshot(grid: MazeGrid, tree) -> tuple:
+    """Все, что определяет лабиринт: проходы, родители и порядок посещения."""
+    parents = tuple(cell.parent.coords if cell.parent else None for cell in grid)
+    visits = tuple(cell.coords for cell in tree.visit_order)
+    return bytes(grid.link_mask), parents, visits
+
+
+@pytest.mark.parametrize("make", GENERATORS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("seed", [0, 1, 7])
+def test_recorder_does_not_change_maze(make, size, seed):
+    width, height = size
+    start = (width // 2, height // 2)
+
+    grid = MazeGrid(width, height)
+    plain = _snapshot(grid, make(seed).generate(grid, start))
+
+    recorder = AnimationRecorder()
+    grid = MazeGrid(width, height)
+    recorded = _snapshot(grid, make(seed).generate(grid, start, recorder=recorder))
+
+    assert plain == recorded
+
+
+@pytest.mark.parametrize("make", GENERATORS)
+@pytest.mark.parametrize("size", SIZES)
+def test_generates_spanning_tree(make, size):
+    width, height = size
+    grid = MazeGrid(width, height)
+    tree = make(3).generate(grid, (0, 0))
+
+    # Остовное дерево: ровно N - 1 проходов...
+    links = sum(len(grid.linked(cell)) for cell in grid) // 2
+    assert links == width * height - 1
+
+    # ...и все клетки достижимы из корня по проходам
+    seen = {tree.root}
+    stack = [tree.root]
+    while stack:
+        for neighbor in grid.linked(stack.pop()):
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    assert len(seen) == width * height
+
+
+@pytest.mark.parametrize("size", [(7, 5), (16, 16)])
+def test_parallel_pool_matches_in_process(monkeypatch, size):
+    # Порог снижен, чтобы даже маленькая сетка строилась в пуле процессов
+    monkeypatch.setattr(parallel_spanning_tree, "MIN_PARALLEL_CELLS", 0)
+    width, height = size
+    snapshots = []
+    for workers in (1, 2):
+        grid = MazeGrid(width, height)
+        generator = ParallelSpanningTreeGenerator(seed=11, tiles=3, workers=workers)
+        snapshots.append(_snapshot(grid, generator.generate(grid, (1, 2))))
+
+    assert snapshots[0] == snapshots[1]
@@ -0,0 +1,23 @@
+"""Проверки сетки лабиринта."""
+
+from __future__ import annotations
+
+import pytest
+
+from maze_py import MazeGrid
+
+
+def test_links_reflect_grid_and_are_read_only():
+    grid = MazeGrid(3, 3)
+    center, east, south = grid.cell(1, 1), grid.cell(2, 1), grid.cell(1, 2)
+    grid.link(center, east)
+    grid.link(center, south, weight=5)
+
+    links = center.links
+    assert dict(links) == {east: 1, south: 5}
+
+    with pytest.raises(TypeError):
+        links[grid.cell(0, 1)] = 1  # type: ignore[index]
+
+    grid.unlink(center, south)
+    assert dict(center.links) == {east: 1}
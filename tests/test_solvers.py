@@ -0,0 +1,74 @@
+"""Проверки решателей лабиринтов."""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import pytest
+
+from maze_py import (
+    AnimationRecorder,
+    BidirectionalBFSSolver,
+    BreadthFirstSolver,
+    MazeGrid,
+    SpanningTreeGenerator,
+)
+from maze_py.grid import Cell, MazeTree
+from maze_py.solvers import DepthFirstSolver
+from maze_py.solvers.base import MazeSolver
+
+SOLVERS = [BreadthFirstSolver, DepthFirstSolver, BidirectionalBFSSolver]
+
+
+class LegacySolver(MazeSolver):
+    """Решатель в стиле README до появления счетчика: возвращает (путь, исследованные)."""
+
+    name = "legacy"
+
+    def _traverse(
+        self,
+        tree: MazeTree,
+        target: Tuple[int, int],
+        *,
+        recorder: AnimationRecorder | None = None,
+    ) -> Tuple[List[Cell], List[Cell]]:
+        goal = tree.grid.cell(*target)
+        parents = {tree.root: None}
+        stack = [tree.root]
+        explored: List[Cell] = []
+        while stack:
+            cell = stack.pop()
+            explored.append(cell)
+            if cell is goal:
+                break
+            for neighbor in tree.grid.linked(cell):
+                if neighbor not in parents:
+                    parents[neighbor] = cell
+                    stack.append(neighbor)
+        return self._build_path(parents, goal), explored
+
+
+@pytest.fixture
+def tree() -> MazeTree:
+    return SpanningTreeGenerator(seed=5).generate(MazeGrid(12, 9), (0, 0))
+
+
+def test_legacy_two_tuple_contract(tree):
+    solution = LegacySolver().solve(tree, (11, 8))
+    expected = BreadthFirstSolver().solve(tree, (11, 8))
+
+    assert solution.path == expected.path
+    assert solution.stats.nodes_expanded == len(solution.explored)
+
+
+@pytest.mark.parametrize("solver_cls", SOLVERS)
+@pytest.mark.parametrize("target", [(0, 0), (11, 8), (6, 4)])
+def test_explored_is_opt_in(tree, solver_cls, target):
+    plain = solver_cls().solve(tree, target)
+    kept = solver_cls(keep_explored=True).solve(tree, target)
+    recorded = solver_cls().solve(tree, target, recorder=AnimationRecorder())
+
+    assert plain.explored is None
+    assert recorded.explored is None
+    assert plain.path == kept.path == recorded.path == tree.path_to(tree.grid.cell(*target))
+    assert len(kept.explored) == kept.stats.nodes_expanded == plain.stats.nodes_expanded